@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+"""Benchmarks boards sharing one window and board snapshots, use SDL_VIDEODRIVER=dummy to run headless."""
+
+from math import ceil, sqrt
+from time import perf_counter
+
+from pygame import init, quit, display, event, Rect, Surface, MOUSEBUTTONDOWN
+
+from whackamole import Board
+from whackamole.mole import Mole
+from whackamole.constants import Constants
+
+FRAMES = 300
+BOARDS = (1, 2, 4, 8, 16)
+SNAPSHOTS = 1000
+MOLES = (30, 1000, 5000, 10000)
+
+
+def bench(count, scale=1):
+    """
+    Steps :count: boards rendering into subsurfaces of one window, each :scale: of the game size
+    Returns average ms per frame
+    """
+
+    width = int(Constants.GAMEWIDTH * scale)
+    height = int(Constants.GAMEHEIGHT * scale)
+    columns = ceil(sqrt(count))
+    rows = ceil(count / columns)
+    screen = display.set_mode((width * columns, height * rows))
+
+    boards = []
+    for i in range(count):
+        rect = Rect((i % columns) * width, (i // columns) * height, width, height)
+        boards.append(Board(screen.subsurface(rect), timer=FRAMES))
+
+    # Click each board to start its timer, every board gets every event like a real host
+    start = [event.Event(MOUSEBUTTONDOWN, button=Constants.LEFTMOUSEBUTTON,
+                         pos=(board.offset[0] + width // 2, board.offset[1] + height // 2)) for board in boards]
+    pos = start[0].pos
+    for board in boards:
+        board.step(start, pos)
+
+    began = perf_counter()
+    for _ in range(FRAMES):
+        event.pump()
+        for board in boards:
+            board.step((), pos)
+        display.flip()
+    return (perf_counter() - began) * 1000 / FRAMES
+
+
+def bench_snapshot(count):
+    """
+    Snapshots and restores a board with :count: moles and holes
+    Returns (bytes, save us, restore us)
+    """
+
+    board = Board(Surface((Constants.GAMEWIDTH, Constants.GAMEHEIGHT)), timer=60)
+
+    # Grow the board past the constants, one hole per mole
+    board.holes = [board.holes[i % len(board.holes)] for i in range(count)]
+    board.used_holes = [False] * count
+    board.free_holes = list(range(count))
+    positions = Mole.build_positions(board.holes)
+    board.moles = [Mole(positions, board.random) for _ in range(count)]
+
+    # Get some moles up
+    pos = (0, 0)
+    board.step([event.Event(MOUSEBUTTONDOWN, button=Constants.LEFTMOUSEBUTTON, pos=pos)], pos)
+    for _ in range(30):
+        board.step((), pos)
+
+    began = perf_counter()
+    for _ in range(SNAPSHOTS):
+        data = board.snapshot()
+    save = (perf_counter() - began) * 1000000 / SNAPSHOTS
+
+    began = perf_counter()
+    for _ in range(SNAPSHOTS):
+        board.restore(data)
+    restore = (perf_counter() - began) * 1000000 / SNAPSHOTS
+
+    return (len(data), save, restore)
+
+
+def main():
+    init()
+
+    budget = 1000 / Constants.GAMEMAXFPS
+    for scale in (1, 0.5):
+        print("{:>6} {:>10} {:>10} {:>10}  (x{} size)".format("boards", "ms/frame", "ms/board", "fits", scale))
+        for count in BOARDS:
+            ms = bench(count, scale)
+            print("{:>6} {:>10.2f} {:>10.2f} {:>10}".format(count, ms, ms / count, "yes" if ms <= budget else "no"))
+        print()
+
+    print("{:>6} {:>10} {:>10} {:>10}".format("moles", "bytes", "save us", "restore us"))
+    for count in MOLES:
+        size, save, restore = bench_snapshot(count)
+        print("{:>6} {:>10,} {:>10.1f} {:>10.1f}".format(count, size, save, restore))
+
+    quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+import os
+
+# Run headless, with SDL's software renderer for the texture backend
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_RENDER_DRIVER", "software")
+
+# Asset paths are relative to the repo root
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def pygame_init():
+    pygame.init()
+    yield
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """
+    Freezes pygame.time.get_ticks, returns a one item list holding the ticks to move the clock
+    """
+
+    ticks = [100000]
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: ticks[0])
+    return ticks
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+from pygame import Surface, image
+
+from whackamole import Board
+from whackamole.constants import Constants
+from whackamole.mole import MoleState
+
+
+def new_board(**kwargs):
+    return Board(Surface((Constants.GAMEWIDTH, Constants.GAMEHEIGHT)), timer=60, **kwargs)
+
+
+def test_atlas_matches_sprites():
+    board = new_board()
+    sprites = {
+        "mole_normal": board.img_mole_normal,
+        "mole_hit": board.img_mole_hit,
+        "mallet_normal": board.img_mallet_normal,
+        "mallet_hit": board.img_mallet_hit,
+    }
+
+    assert set(board.atlas) == set(sprites)
+    for name, sprite in sprites.items():
+        area = board.img_atlas.subsurface(board.atlas[name])
+        assert image.tobytes(area, "RGBA") == image.tobytes(sprite, "RGBA"), name
+
+
+def test_boards_share_atlas_unmodified(frozen_clock):
+    board = new_board()
+    other = new_board()
+    assert other.atlas is board.atlas
+
+    for _ in range(30):
+        frozen_clock[0] += 16
+        board.step((), (0, 0))
+    assert set(board.atlas) == {"mole_normal", "mole_hit", "mallet_normal", "mallet_hit"}
+
+    # Shown moles draw from the atlas, hidden ones the board's own empty rect
+    for mole, draw in zip(board.moles, board.sprite_draws):
+        if mole.showing_state == MoleState.HIDDEN:
+            assert draw[2] is board.area_none
+        else:
+            assert draw[2] is board.atlas["mole_normal"]
+
+
+def test_sprite_layer_draws_hidden_moles_empty(frozen_clock):
+    board = new_board(adaptive=True)
+
+    # Moles stay hidden behind the adaptive start screen
+    for _ in range(5):
+        frozen_clock[0] += 16
+        board.step((), (0, 0))
+        assert len(board.sprite_draws) == len(board.moles) + 1
+        assert all(draw[2] is board.area_none for draw in board.sprite_draws[:-1])
+        assert board.sprite_draws[-1][2] == board.atlas["mallet_normal"]
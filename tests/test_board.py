@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+from pygame import Rect, Surface, event, MOUSEBUTTONDOWN, KEYDOWN, K_ESCAPE
+
+from whackamole import Board, Game
+from whackamole.constants import Constants
+
+
+def click(pos):
+    return event.Event(MOUSEBUTTONDOWN, button=Constants.LEFTMOUSEBUTTON, pos=pos)
+
+
+def test_game_size_target_is_drawn_to_directly():
+    target = Surface((Constants.GAMEWIDTH, Constants.GAMEHEIGHT))
+    board = Board(target, timer=60)
+    assert board.screen is target
+
+
+def test_other_size_target_is_scaled_into():
+    target = Surface((Constants.GAMEWIDTH // 2, Constants.GAMEHEIGHT // 2))
+    target.fill((255, 0, 255))
+    board = Board(target, timer=60)
+    assert board.screen is not target
+
+    board.step((), (0, 0))
+    assert target.get_at((10, target.get_height() // 2)) != (255, 0, 255, 255)
+
+
+def test_other_size_target_scales_the_mouse():
+    target = Surface((Constants.GAMEWIDTH // 2, Constants.GAMEHEIGHT // 2))
+    board = Board(target, timer=60)
+
+    board.step([click((100, 200))], (100, 200))
+    assert board.mouse_pos == (200, 400)
+    assert board.timer_start != 0
+
+
+def test_boards_sharing_a_window_only_take_their_own_input():
+    width, height = Constants.GAMEWIDTH // 2, Constants.GAMEHEIGHT // 2
+    window = Surface((width * 2, height))
+    left = Board(window.subsurface(Rect(0, 0, width, height)), timer=60)
+    right = Board(window.subsurface(Rect(width, 0, width, height)), timer=60)
+
+    # Every board gets every event, with the mouse over the right board
+    pos = (width + 10, 10)
+    for events in ([click(pos)], [click(pos)]):
+        for board in (left, right):
+            board.step(events, pos)
+    assert left.timer_start == 0
+    assert right.timer_start != 0
+    assert (left.score.misses, right.score.misses) == (0, 1)
+    assert right.mouse_pos == (20, 20)
+
+    # Keys go to the board under the mouse
+    left.step([click((10, 10))], (10, 10))
+    for board in (left, right):
+        board.step([event.Event(KEYDOWN, key=K_ESCAPE)], pos)
+    assert left.timer_start != 0
+    assert right.timer_start == 0
+
+
+def test_scaled_game_unscales_mouse_events():
+    game = Game(timer=60, autostart=False, textures=True, scale=2)
+    events = game.unscale([click((300, 500)), event.Event(KEYDOWN, key=K_ESCAPE)])
+    assert events[0].pos == (150, 250)
+    assert events[0].button == Constants.LEFTMOUSEBUTTON
+    assert events[1].key == K_ESCAPE
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+import tracemalloc
+
+from pygame import Surface, event, MOUSEBUTTONDOWN
+
+from whackamole import Board
+from whackamole.constants import Constants
+
+
+def mole_state(board):
+    return ([(m.showing_state, m.show_frame, m.current_hole, m.cooldown, m.showing_counter, m.hit)
+             for m in board.moles], list(board.free_holes))
+
+
+def test_tick_allocations_none_without_tracing():
+    board = Board(Surface((Constants.GAMEWIDTH, Constants.GAMEHEIGHT)), timer=60)
+    board.step((), (0, 0))
+    assert board.tick_allocations is None
+
+
+def test_steady_tick_allocates_nothing(frozen_clock):
+    board = Board(Surface((Constants.GAMEWIDTH, Constants.GAMEHEIGHT)), timer=600)
+    board.random.seed(1)
+    board.step([event.Event(MOUSEBUTTONDOWN, button=Constants.LEFTMOUSEBUTTON, pos=(0, 0))], (0, 0))
+
+    tracemalloc.start()
+    try:
+        steady = []
+        for frame in range(1200):
+            # Move the clock every few frames so holds, cooldowns and stuns also expire
+            if frame % 30 == 0:
+                frozen_clock[0] += 100
+            before = mole_state(board)
+            board.step((), (0, 0))
+            if mole_state(board) == before:
+                steady.append(board.tick_allocations)
+    finally:
+        tracemalloc.stop()
+
+    assert len(steady) > 100
+    assert set(steady) == {0}
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+from pygame import Surface
+
+from whackamole import Board
+from whackamole.constants import Constants
+from whackamole.mole import MoleState
+
+
+def new_board(**kwargs):
+    return Board(Surface((Constants.GAMEWIDTH, Constants.GAMEHEIGHT)), timer=60, **kwargs)
+
+
+def test_start_screen_sleeps_until_input_when_adaptive(frozen_clock):
+    board = new_board(adaptive=True)
+    board.step((), (0, 0))
+    assert board.next_change(False) is None
+
+    # Without adaptive pacing the moles tick behind the start screen
+    assert new_board().next_change(False) == 0
+
+
+def test_end_screen_wakes_for_cooldown(frozen_clock):
+    board = new_board(adaptive=True)
+    now = frozen_clock[0]
+    board.timer_start = now - 61000
+    mole = board.moles[0]
+    mole.cooldown = now - 100
+    mole.update_deadlines()
+    assert board.next_change(False) == Constants.MOLECOOLDOWN - 100
+
+
+def test_stunned_mole_wakes_when_unfrozen(frozen_clock):
+    mole = new_board().moles[0]
+    mole.showing_state = MoleState.UP
+    mole.hit = frozen_clock[0] - 300
+    mole.update_deadlines()
+    assert mole.next_change(False) == Constants.MOLESTUNNED - 300
+    assert mole.next_change(True) == 0
+
+
+def test_hit_indicator_wakes_when_hidden(frozen_clock):
+    board = new_board(adaptive=True)
+    board.loop_display(False, True, False)
+    assert board.next_change(False) == Constants.MOLEHITHUD + 1
+
+    frozen_clock[0] += 200
+    wait = board.next_change(False)
+    assert wait == Constants.MOLEHITHUD + 1 - 200
+
+    # Still shown a millisecond before, hidden at the wake up
+    frozen_clock[0] += wait - 1
+    board.loop_display(False, False, False)
+    assert board.show_hit != 0
+    frozen_clock[0] += 1
+    board.loop_display(False, False, False)
+    assert board.show_hit == 0
+    assert board.next_change(False) is None
+
+
+def test_timer_wakes_as_shown_second_changes(frozen_clock):
+    board = new_board()
+    board.moles = []
+    start = frozen_clock[0]
+    board.timer_start = start
+
+    def shown():
+        return board.score.disp_score(board.timerData[0], {})
+
+    for elapsed in list(range(0, 3000, 37)) + [499, 500, 501, 1499, 1500, 59499, 59500, 59999]:
+        frozen_clock[0] = start + elapsed
+        before = shown()
+        wait = board.next_change(False)
+        assert wait > 0
+
+        frozen_clock[0] += wait - 1
+        assert shown() == before, elapsed
+        frozen_clock[0] += 1
+        assert shown() != before, elapsed
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+from pygame import Surface
+
+from whackamole import Board
+from whackamole.constants import Constants
+from whackamole.mole import MoleState
+from whackamole.score import Score, ScoreEvent
+from whackamole.text import Text
+
+
+def test_set_notifies_only_on_change():
+    score = Score(Text())
+    events = []
+    score.subscribe(lambda event, score: events.append(event))
+
+    score.set(hits=0, misses=0)
+    assert events == []
+
+    score.hit()
+    assert events == [ScoreEvent.CHANGE]
+
+
+def test_set_without_notify_still_updates():
+    score = Score(Text())
+    events = []
+    score.subscribe(lambda event, score: events.append(event))
+
+    score.set(hits=10, notify=False)
+    assert events == []
+    assert score.attempts == 10 and score.level > 1
+
+
+def test_level_up_on_board(frozen_clock):
+    board = Board(Surface((Constants.GAMEWIDTH, Constants.GAMEHEIGHT)), timer=60)
+    score = board.score
+
+    # A mole held up for as long as level 1 allows
+    mole = board.moles[0]
+    mole.showing_state = MoleState.UP
+    mole.showing_counter = frozen_clock[0]
+    mole.show_time = mole.timeLimits(1)[1]
+    mole.update_deadlines()
+
+    label = score.label()
+    hits = Constants.LEVELGAP // 2  # 2 points per hit
+    for _ in range(hits):
+        assert score.level == 1
+        score.hit()
+    assert score.level == 2
+
+    # Every change recorded, with one level up on the last hit
+    assert [entry[1:] for entry in board.telemetry] == \
+        [(ScoreEvent.CHANGE, hit, 0, 1) for hit in range(1, hits)] + \
+        [(ScoreEvent.CHANGE, hits, 0, 2), (ScoreEvent.LEVEL, hits, 0, 2)]
+
+    # Held moles are cut to the new level's limit
+    assert mole.show_time == mole.timeLimits(2)[1] < mole.timeLimits(1)[1]
+    assert mole.hold_end == mole.showing_counter + mole.show_time
+
+    # The HUD label is rendered again
+    assert score.segment_score is None
+    assert score.label() is not label
+    assert "Level: 2" in score.segment_score
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+import pytest
+from pygame import Surface
+
+from whackamole import Board
+from whackamole.constants import Constants
+from whackamole.snapshot import Snapshot
+
+
+def new_board():
+    return Board(Surface((Constants.GAMEWIDTH, Constants.GAMEHEIGHT)), timer=60)
+
+
+def test_restore_round_trips(frozen_clock):
+    board = new_board()
+    board.step((), (0, 0))
+    data = board.snapshot()
+
+    other = new_board()
+    other.restore(data)
+    assert other.snapshot() == data
+
+
+def test_restore_keeps_gauss_state(frozen_clock):
+    board = new_board()
+    board.random.gauss(0, 1)
+    data = board.snapshot()
+
+    other = new_board()
+    other.restore(data)
+    assert other.random.getstate() == board.random.getstate()
+
+
+def corrupt(board, snapshot, offset, value):
+    """
+    Replaces the value at :offset: after the RNG state in :snapshot:, 0 being the first free hole
+    """
+
+    layout = Snapshot.struct(len(board.holes), len(board.moles))
+    values = list(layout.unpack(snapshot))
+    values[10 + 627 + offset] = value
+    return layout.pack(*values)
+
+
+@pytest.mark.parametrize("data", [b"", b"WAMS", "truncated", "oversized", "free hole", "negative free hole",
+                                  "duplicate free hole", "current hole", "last hole", "showing state"])
+def test_restore_rejects_bad_sizes(frozen_clock, data):
+    board = new_board()
+    board.score.set(hits=3)
+    snapshot = board.snapshot()
+    holes = len(board.holes)
+    if data == "truncated":
+        data = snapshot[:-1]
+    elif data == "oversized":
+        data = snapshot + b"\0"
+    elif data == "free hole":
+        data = corrupt(board, snapshot, 0, 9999)
+    elif data == "negative free hole":
+        data = corrupt(board, snapshot, 0, -3)
+    elif data == "duplicate free hole":
+        data = corrupt(board, snapshot, 1, 0)
+    elif data == "current hole":
+        data = corrupt(board, snapshot, holes + 2, 5000)
+    elif data == "last hole":
+        data = corrupt(board, snapshot, holes + 3, -2)
+    elif data == "showing state":
+        data = corrupt(board, snapshot, holes, 5)
+
+    other = new_board()
+    before = other.snapshot()
+    with pytest.raises(ValueError):
+        other.restore(data)
+    assert other.snapshot() == before
+
+
+def test_restore_does_not_notify_score_subscribers(frozen_clock):
+    board = new_board()
+    board.score.set(hits=12, misses=3)
+    data = board.snapshot()
+
+    other = new_board()
+    events = []
+    other.score.subscribe(lambda event, score: events.append(event))
+    other.restore(data)
+    assert events == []
+    assert (other.score.hits, other.score.misses, other.score.level) == \
+        (board.score.hits, board.score.misses, board.score.level)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+import pygame
+from pygame import event, MOUSEBUTTONDOWN
+
+from whackamole import Game
+from whackamole.constants import Constants
+from whackamole.text import Text
+
+
+def click(pos):
+    return [event.Event(MOUSEBUTTONDOWN, button=Constants.LEFTMOUSEBUTTON, pos=pos)]
+
+
+def test_quit_drops_cached_fonts_and_labels():
+    Text().get_label("x")
+    assert Text.fonts and Text.labels
+
+    pygame.quit()
+    assert not Text.fonts and not Text.labels
+
+    # Rendering with a font freed by quit would crash
+    pygame.init()
+    assert Text().get_label("xy").get_width() > 0
+
+
+def test_game_restarts_in_process():
+    for _ in range(2):
+        game = Game(timer=60, autostart=False)
+        game.step((), (0, 0))
+        game.step(click((10, 10)), (10, 10))
+        game.step(click((10, 10)), (10, 10))
+        pygame.quit()
+    assert game.score.misses == 1
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+import pytest
+from pygame import Surface, event, image, transform, MOUSEBUTTONDOWN
+
+from whackamole import Board
+from whackamole.constants import Constants
+from whackamole.textures import TextureSurface
+
+# Max per-channel difference, SDL's renderer rounds alpha blending slightly differently to blits
+TOLERANCE = 8
+
+
+def click(pos):
+    return [event.Event(MOUSEBUTTONDOWN, button=Constants.LEFTMOUSEBUTTON, pos=pos)]
+
+
+def max_difference(expected, actual):
+    expected = image.tobytes(expected, "RGB")
+    actual = image.tobytes(actual, "RGB")
+    return max(abs(a - b) for a, b in zip(expected, actual))
+
+
+@pytest.mark.parametrize("scale", [1, 2])
+def test_matches_blit_path(frozen_clock, scale):
+    size = (Constants.GAMEWIDTH, Constants.GAMEHEIGHT)
+    soft = Board(Surface(size), timer=60)
+    soft.random.seed(1)
+    textures = TextureSurface(scale=scale)
+    tex = Board(textures, timer=60)
+
+    # Start screen, play with moles up and hits/misses, then the end screen
+    script = [((), (250, 300)), (click((250, 300)), (250, 300))]
+    script += [((), (frame * 3, 300 + frame)) for frame in range(60)]
+    script += [(click((x, 400)), (x, 400)) for x in range(0, 500, 50)]
+    script += [("end", (100, 100))]
+
+    checked = 0
+    for frame, (events, pos) in enumerate(script):
+        if events == "end":
+            frozen_clock[0] += 61000
+            events = ()
+        else:
+            frozen_clock[0] += 16
+
+        # Keep the boards in lockstep
+        tex.restore(soft.snapshot())
+        soft.step(events, pos)
+        tex.step(events, pos)
+
+        # Compare every few frames, the comparison is slow
+        if frame % 5 == 0 or frame == len(script) - 1:
+            actual = transform.scale(textures.to_surface(), size)
+            assert max_difference(soft.screen, actual) <= TOLERANCE, "frame {}".format(frame)
+            checked += 1
+        textures.flip()
+
+    assert checked > 10
@@ -7,4 +7,5 @@ A simple Whack a Mole game written with PyGame
 :copyright: (c) 2018 Matt Cowley (IPv4)
 """
 
+from .board import Board
 from .game import Game
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+from pygame import display, image, transform, Surface, SRCALPHA
+
+
+class Assets:
+    """
+    Loads and caches the surfaces shared by every board in the process
+    """
+
+    cache = {}
+
+    @classmethod
+    def image(cls, path, size):
+        """
+        Loads the image at :path: scaled to :size:, in the display format if there is one
+        Returns PyGame surface
+        """
+
+        key = ("image", path, size)
+        if key not in cls.cache:
+            surface = transform.scale(image.load(path), size)
+            if display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            cls.cache[key] = surface
+        return cls.cache[key]
+
+    @classmethod
+    def rotate(cls, surface, angle):
+        """
+        Rotates :surface: by :angle: degrees
+        Returns PyGame surface
+        """
+
+        key = ("rotate", id(surface), angle)
+        if key not in cls.cache:
+            cls.cache[key] = transform.rotate(surface, angle)
+        return cls.cache[key]
+
+    @classmethod
+    def atlas(cls, sprites):
+        """
+        Packs the named :sprites: side by side into one sheet
+        Returns (PyGame surface, dict of name to sub-rect)
+        """
+
+        key = ("atlas",) + tuple((name, id(sprite)) for name, sprite in sprites.items())
+        if key not in cls.cache:
+            width = sum(sprite.get_width() for sprite in sprites.values())
+            height = max(sprite.get_height() for sprite in sprites.values())
+            surface = Surface((width, height), SRCALPHA, 32)
+            if display.get_surface() is not None:
+                surface = surface.convert_alpha()
+
+            # Blitting onto fully transparent pixels copies them as is
+            rects = {}
+            x = 0
+            for name, sprite in sprites.items():
+                rects[name] = surface.blit(sprite, (x, 0))
+                x += sprite.get_width()
+            cls.cache[key] = (surface, rects)
+        return cls.cache[key]
+
+    @classmethod
+    def static(cls, background, hole, holes):
+        """
+        Composites the :hole: surface at each of :holes: over :background:
+        Returns opaque PyGame surface
+        """
+
+        key = ("static", id(background), id(hole), tuple(holes))
+        if key not in cls.cache:
+            surface = Surface(background.get_size())
+            surface.blit(background, (0, 0))
+            for position in holes:
+                surface.blit(hole, position)
+            cls.cache[key] = surface
+        return cls.cache[key]
+
+    @classmethod
+    def overlay(cls, size):
+        """
+        Generates the fade overlay for the start and end screens
+        Returns PyGame surface
+        """
+
+        key = ("overlay", size)
+        if key not in cls.cache:
+            surface = Surface(size, SRCALPHA, 32)
+            if display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            surface.fill((100, 100, 100, 0.9 * 255))
+            cls.cache[key] = surface
+        return cls.cache[key]
@@ -0,0 +1,510 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+from collections import deque
+from random import Random
+import tracemalloc
+
+from pygame import time, transform, Rect, Surface, \
+    QUIT, MOUSEBUTTONDOWN, KEYDOWN, \
+    K_e, K_r, K_t, K_y, K_u, K_i, K_o, K_p, K_SPACE, K_ESCAPE
+
+from .assets import Assets
+from .constants import Constants
+from .mole import Mole, MoleEvent
+from .score import Score, ScoreEvent
+from .snapshot import Snapshot
+from .text import Text
+
+
+class Board:
+    """
+    Handles a single game board, rendering to any surface and stepped externally
+    Takes :surface: as the target to render to (eg. a window subsurface)
+    Targets other than GAMEWIDTH x GAMEHEIGHT are rendered at that size then scaled in
+    Mouse input is in window coordinates, so boards on subsurfaces of one window can share events
+    Takes :timer: in seconds for game timer
+    Takes :adaptive: to freeze the moles behind the click to begin screen, see Game
+    """
+
+    # Bytes allocated by the tracemalloc readings themselves, see trace_overhead
+    tick_overhead = None
+
+    def __init__(self, surface, *, timer: int = None, adaptive: bool = False):
+        # Target surface, and the surface rendered to at game size
+        self.target = surface
+        if surface.get_size() == (Constants.GAMEWIDTH, Constants.GAMEHEIGHT):
+            self.screen = surface
+        else:
+            self.screen = Surface((Constants.GAMEWIDTH, Constants.GAMEHEIGHT))
+
+        # Load images, shared by all boards
+        self.img_background = Assets.image(Constants.IMAGEBACKGROUND, (Constants.GAMEWIDTH, Constants.GAMEHEIGHT))
+        self.img_hole = Assets.image(Constants.IMAGEHOLE, (Constants.HOLEWIDTH, Constants.HOLEHEIGHT))
+        self.img_mole_normal = Assets.image(Constants.IMAGEMOLENORMAL, (Constants.MOLEWIDTH, Constants.MOLEHEIGHT))
+        self.img_mole_hit = Assets.image(Constants.IMAGEMOLEHIT, (Constants.MOLEWIDTH, Constants.MOLEHEIGHT))
+        self.img_mallet = Assets.image(Constants.IMAGEMALLET, (Constants.MALLETWIDTH, Constants.MALLETHEIGHT))
+        self.img_mallet_normal = Assets.rotate(self.img_mallet, Constants.MALLETROTNORM)
+        self.img_mallet_hit = Assets.rotate(self.img_mallet, Constants.MALLETROTHIT)
+
+        # Pack sprites into one sheet, drawn by sub-rect
+        self.img_atlas, self.atlas = Assets.atlas({
+            "mole_normal": self.img_mole_normal,
+            "mole_hit": self.img_mole_hit,
+            "mallet_normal": self.img_mallet_normal,
+            "mallet_hit": self.img_mallet_hit,
+        })
+
+        # Empty area for sprite draws with nothing to show, kept off the shared atlas rects
+        self.area_none = Rect(0, 0, 0, 0)
+
+        # Where the target is in the window, for mapping the mouse
+        self.offset = surface.get_abs_offset() if isinstance(surface, Surface) else (0, 0)
+
+        # Set timer
+        self.timer = timer
+
+        # Set frame pacing
+        self.adaptive = adaptive
+
+        # Clock for debug FPS readout, ticked by whoever steps the board
+        self.clock = time.Clock()
+        self.loop = True
+
+        # Mouse position on the board at game size
+        self.mouse_pos = (0, 0)
+
+        # RNG for the moles, part of the board state
+        self.random = Random()
+
+        # Recent score changes as (ticks, ScoreEvent, hits, misses, level)
+        self.telemetry = deque(maxlen=Constants.GAMETELEMETRY)
+
+        # Reset/initialise data
+        self.reset()
+
+    def reset(self):
+        # Generate hole positions
+        self.holes = []
+        base_row = Constants.GAMEHEIGHT / Constants.HOLEROWS
+        base_column = Constants.GAMEWIDTH / Constants.HOLECOLUMNS
+        for row in range(Constants.HOLEROWS):
+            rowY = base_row * row
+            rowY += (base_row - Constants.HOLEHEIGHT) / 2
+            for column in range(Constants.HOLECOLUMNS):
+                thisX = base_column * column
+                thisX += (base_column - Constants.HOLEWIDTH) / 2
+                self.holes.append((int(thisX), int(rowY)))
+
+        # Background and holes never change, so are composited once
+        self.img_static = Assets.static(self.img_background, self.img_hole, self.holes)
+
+        # Track hole usage by index, free_holes is only ever shuffled in place
+        self.used_holes = [False] * len(self.holes)
+        self.free_holes = list(range(len(self.holes)))
+
+        # Load moles
+        positions = Mole.build_positions(self.holes)
+        self.moles = [Mole(positions, self.random) for _ in range(Constants.MOLECOUNT)]
+
+        # Bytes allocated by the last mole tick, None unless tracemalloc is tracing
+        self.tick_allocations = None
+
+        # Sprite layer, an entry per mole plus the mallet, hidden entries draw the empty rect
+        self.sprite_draws = []
+
+        # Get the text object
+        self.text = Text()
+
+        # Get the score object
+        self.score = Score(self.text)
+        self.score.subscribe(self.score_changed)
+
+        # Indicates whether the HUD indicators should be displayed
+        self.show_hit = 0
+        self.show_miss = 0
+
+        # Allow for game timer
+        self.timer_start = 0
+
+    @property
+    def timerData(self):
+        if self.timer is not None and self.timer_start != 0:
+            remain = (time.get_ticks() - self.timer_start) / 1000
+            remain = self.timer - remain
+            endGame = True if remain <= 0 else False
+            return (remain, endGame)
+        return (None, False)
+
+    @property
+    def ticking(self):
+        """
+        Whether moles should tick this frame
+        Adaptive pacing freezes the moles behind the click to begin screen so it can idle
+        """
+
+        if self.timer and self.timer_start == 0:
+            return not self.adaptive
+        return not self.timerData[1]
+
+    def next_change(self, clicked):
+        """
+        Returns ms until the display next changes by itself, 0 if it is animating, None if it never will
+        """
+
+        # Mallet needs to swing back
+        if clicked:
+            return 0
+
+        changes = []
+        now = time.get_ticks()
+        gameTime, endGame = self.timerData
+
+        # Moles
+        do_tick = self.ticking
+        for mole in self.moles:
+            change = mole.next_change(do_tick)
+            if change == 0:
+                return 0
+            if change is not None:
+                changes.append(change)
+
+        if not endGame:
+            # Hit/miss indicators, shown while within (inclusive) their HUD time
+            if self.show_hit != 0:
+                changes.append(max(0, Constants.MOLEHITHUD + 1 - (now - self.show_hit)))
+            if self.show_miss != 0:
+                changes.append(max(0, Constants.MOLEMISSHUD + 1 - (now - self.show_miss)))
+
+            # Timer readout, rounded half up to whole seconds so it changes as x.5s becomes x.499s
+            if gameTime is not None:
+                remain = int(self.timer * 1000) - (now - self.timer_start)
+                changes.append(min(remain, (remain - 500) % 1000 + 1))
+
+        return min(changes) if changes else None
+
+    def board_pos(self, pos):
+        """
+        Maps :pos: in window coordinates onto the board at game size
+        Returns (x, y), outside 0 <= x < GAMEWIDTH, 0 <= y < GAMEHEIGHT if not over the board
+        """
+
+        width, height = self.target.get_size()
+        return ((pos[0] - self.offset[0]) * Constants.GAMEWIDTH // width,
+                (pos[1] - self.offset[1]) * Constants.GAMEHEIGHT // height)
+
+    @staticmethod
+    def on_board(pos):
+        return 0 <= pos[0] < Constants.GAMEWIDTH and 0 <= pos[1] < Constants.GAMEHEIGHT
+
+    def loop_events(self, events, pos):
+        """
+        Handles the given :events:, with :pos: as the mouse position on the board at game size
+        Clicks outside the board are ignored, as are keys unless the mouse is over the board
+        Returns (clicked, hit, miss)
+        """
+
+        hit = False
+        miss = False
+        clicked = False
+        self.mouse_pos = pos
+        focused = self.on_board(pos)
+
+        # Handle PyGame events
+        for e in events:
+
+            # Handle quit
+            if e.type == QUIT:
+                self.loop = False
+                break
+
+            gameTime, endGame = self.timerData
+
+            if not endGame:
+
+                # Handle click, if on this board
+                if e.type == MOUSEBUTTONDOWN and e.button == Constants.LEFTMOUSEBUTTON:
+                    click_pos = self.board_pos(e.pos)
+                    if not self.on_board(click_pos):
+                        continue
+
+                    # Start timer if not started
+                    if self.timer is not None and self.timer_start == 0:
+                        self.timer_start = time.get_ticks()
+
+                    else:
+                        # Handle hit/miss
+                        clicked = True
+                        miss = True
+                        for mole in self.moles:
+                            mole_hit = mole.is_hit(click_pos)
+                            if mole_hit == 1:  # Hit
+                                hit = True
+                                miss = False
+                            if mole_hit == 2:  # Hit but stunned
+                                miss = False
+
+                        if hit:
+                            self.score.hit()
+                        if miss:
+                            self.score.miss()
+
+                if e.type == KEYDOWN and focused:
+
+                    # Allow escape to abort attempt
+                    if e.key == K_ESCAPE:
+                        self.reset()
+                        break
+
+                    # Handle cheats (for dev work)
+                    if Constants.DEBUGMODE:
+                        if e.key == K_e:
+                            hit = True
+                            miss = False
+                            self.score.hit()
+                        if e.key == K_r:
+                            hit = False
+                            miss = True
+                            self.score.miss()
+
+                        if e.key == K_t:
+                            self.score.set(misses=0)
+                        if e.key == K_y:
+                            self.score.set(misses=self.score.misses + 5)
+                        if e.key == K_u:
+                            self.score.set(misses=self.score.misses - 5)
+
+                        if e.key == K_i:
+                            self.score.set(hits=0)
+                        if e.key == K_o:
+                            self.score.set(hits=self.score.hits + 5)
+                        if e.key == K_p:
+                            self.score.set(hits=self.score.hits - 5)
+
+            # End game screen
+            else:
+                if e.type == KEYDOWN and focused:
+                    if e.key == K_SPACE:
+                        # Restart
+                        self.reset()
+                        break
+
+        return (clicked, hit, miss)
+
+    def score_changed(self, score_event, score):
+        """
+        Handles Score events, rescheduling moles on a new level and recording telemetry
+        """
+
+        if score_event == ScoreEvent.LEVEL:
+            for mole in self.moles:
+                mole.reschedule(score.level)
+
+        self.telemetry.append((time.get_ticks(), score_event, score.hits, score.misses, score.level))
+
+    @classmethod
+    def trace_overhead(cls):
+        """
+        Measures the bytes the tracemalloc readings in loop_moles allocate themselves
+        Returns int
+        """
+
+        if cls.tick_overhead is None:
+            overheads = []
+            for _ in range(3):
+                start = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                overheads.append(tracemalloc.get_traced_memory()[1] - start)
+            cls.tick_overhead = max(overheads)
+        return cls.tick_overhead
+
+    def loop_moles(self, do_tick):
+        """
+        Ticks all moles, filling their entries in the sprite layer
+        Steady-state ticks allocate nothing (for up to 256 moles, beyond which indexes are not cached ints)
+        While tracemalloc is tracing, the bytes allocated by the tick are stored in tick_allocations
+        This is the peak, so includes temporaries, otherwise it is None
+        """
+
+        # Resize the sprite layer if the moles were changed
+        if len(self.sprite_draws) != len(self.moles) + 1:
+            self.sprite_draws = [[self.img_atlas, (0, 0), self.area_none] for _ in range(len(self.moles) + 1)]
+
+        now = time.get_ticks()
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            overhead = self.trace_overhead()
+            start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        draws = self.sprite_draws
+        free_holes = self.free_holes
+        used_holes = self.used_holes
+        level = self.score.level
+        area_normal = self.atlas["mole_normal"]
+        area_hit = self.atlas["mole_hit"]
+        area_none = self.area_none
+
+        # Index loop, as list iterators and enumerate are allocated
+        moles = self.moles
+        count = len(moles)
+        i = 0
+        while i < count:
+            mole = moles[i]
+            mole_display = mole.do_display(free_holes, level, now, do_tick)
+
+            # If new/old hole given
+            if mole_display[1] == MoleEvent.NEW_HOLE:
+                used_holes[mole_display[2]] = True
+                free_holes.remove(mole_display[2])
+            elif mole_display[1] == MoleEvent.OLD_HOLE:
+                if used_holes[mole_display[2]]:
+                    used_holes[mole_display[2]] = False
+                    free_holes.append(mole_display[2])
+
+            # If should display
+            draw = draws[i]
+            if mole_display[0]:
+                # Get pos and display
+                draw[1] = mole.get_hole_pos(now, do_tick)
+                draw[2] = area_hit if mole.hit != 0 else area_normal
+            else:
+                draw[2] = area_none
+
+            i += 1
+
+        if tracing:
+            self.tick_allocations = tracemalloc.get_traced_memory()[1] - start - overhead
+        else:
+            self.tick_allocations = None
+
+    def loop_display(self, clicked, hit, miss):
+        gameTime, endGame = self.timerData
+        if not gameTime and self.timer:
+            gameTime = -1
+
+        # Display bg and holes
+        self.screen.blit(self.img_static, (0, 0))
+
+        # Tick moles
+        self.loop_moles(self.ticking)
+
+        # Hammer
+        thisHammer = self.atlas["mallet_hit" if clicked else "mallet_normal"]
+        hammer_x, hammer_y = self.mouse_pos
+        hammer_x -= thisHammer.width / 5
+        hammer_y -= thisHammer.height / 4
+        self.sprite_draws[-1][1] = (hammer_x, hammer_y)
+        self.sprite_draws[-1][2] = thisHammer
+
+        # Display moles and hammer
+        self.screen.blits(self.sprite_draws, doreturn=False)
+
+        # Fade screen if not started or has ended
+        if self.timer and (endGame or gameTime == -1):
+            self.screen.blit(Assets.overlay((Constants.GAMEWIDTH, Constants.GAMEHEIGHT)), (0, 0))
+
+        # Debug data for readout
+        debug_data = {}
+        if Constants.DEBUGMODE:
+            debug_data = {
+                "DEBUG": True,
+                "FPS": int(self.clock.get_fps()),
+                "MOLES": "{}/{}".format(Constants.MOLECOUNT, Constants.HOLEROWS * Constants.HOLECOLUMNS),
+                "ALLOCS": self.tick_allocations,
+                "KEYS": "E[H]R[M]T[M0]Y[M+5]U[M-5]I[H0]O[H+5]P[H-5]"
+            }
+
+        # Display data readout
+        data = self.score.label(timer=gameTime, debug=debug_data, size=(1.5 if endGame else 1))
+        hud = [(data, (5, 5))]
+
+        # Display hit/miss indicators
+        if not endGame:
+
+            # Hit indicator
+            if hit:
+                self.show_hit = time.get_ticks()
+            if self.show_hit != 0 and time.get_ticks() - self.show_hit <= Constants.MOLEHITHUD:
+                hit_label = self.text.get_label("Hit!", scale=3, color=(255, 50, 0))
+                hit_x = (Constants.GAMEWIDTH - hit_label.get_width()) / 2
+                hit_y = (Constants.GAMEHEIGHT - hit_label.get_height()) / 2
+                hud.append((hit_label, (hit_x, hit_y)))
+            else:
+                self.show_hit = 0
+
+            # Miss indicator
+            if miss:
+                self.show_miss = time.get_ticks()
+            if self.show_miss != 0 and time.get_ticks() - self.show_miss <= Constants.MOLEMISSHUD:
+                miss_label = self.text.get_label("Miss!", scale=2, color=(0, 150, 255))
+                miss_x = (Constants.GAMEWIDTH - miss_label.get_width()) / 2
+                miss_y = (Constants.GAMEHEIGHT + miss_label.get_height()) / 2
+                hud.append((miss_label, (miss_x, miss_y)))
+            else:
+                self.show_miss = 0
+
+        # Click to start indicator
+        if self.timer and gameTime == -1:
+            timer_label = self.text.get_label("Click to begin...", scale=2, color=(0, 255, 255))
+            timer_x = (Constants.GAMEWIDTH - timer_label.get_width()) / 2
+            timer_y = (Constants.GAMEHEIGHT - timer_label.get_height()) / 2
+            hud.append((timer_label, (timer_x, timer_y)))
+
+        # Time's up indicator
+        if self.timer and endGame:
+            timer_label_1 = self.text.get_label("Time's up!", scale=3, color=(0, 150, 255))
+            timer_label_2 = self.text.get_label("Press space to restart...", scale=2, color=(0, 150, 255))
+
+            timer_x_1 = (Constants.GAMEWIDTH - timer_label_1.get_width()) / 2
+            timer_x_2 = (Constants.GAMEWIDTH - timer_label_2.get_width()) / 2
+
+            timer_y_1 = (Constants.GAMEHEIGHT / 2) - timer_label_1.get_height()
+            timer_y_2 = (Constants.GAMEHEIGHT / 2)
+
+            hud.append((timer_label_1, (timer_x_1, timer_y_1)))
+            hud.append((timer_label_2, (timer_x_2, timer_y_2)))
+
+        # Display HUD
+        self.screen.blits(hud, doreturn=False)
+
+    def step(self, events, pos):
+        """
+        Runs a single frame, handling :events: and rendering to the target surface
+        Takes :pos: as the mouse position in window coordinates, like the positions of mouse events
+        Every board in a window can be given all of its events, see loop_events
+        Returns whether the mallet was clicked
+        """
+
+        # Do all events, with the mouse on the board at game size
+        clicked, hit, miss = self.loop_events(events, self.board_pos(pos))
+
+        # Do all render
+        self.loop_display(clicked, hit, miss)
+
+        # Scale into the target
+        if self.screen is not self.target:
+            transform.scale(self.screen, self.target.get_size(), self.target)
+
+        return clicked
+
+    def snapshot(self):
+        """
+        Captures the complete board state, see Snapshot
+        Returns bytes
+        """
+
+        return Snapshot.save(self)
+
+    def restore(self, data):
+        """
+        Restores the board state from a snapshot, with timers continuing from now
+        """
+
+        Snapshot.restore(self, data)
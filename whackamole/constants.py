@@ -18,6 +18,7 @@ class GameConstants:
     GAMEWIDTH       = 500
     GAMEHEIGHT      = 750
     GAMEMAXFPS      = 60
+    GAMETELEMETRY   = 1000 #entries
 
 
 class LevelConstants:
@@ -79,6 +80,7 @@ class TextConstants:
     TEXTTITLE       = "Whack a Mole"
     TEXTFONTSIZE    = 15
     TEXTFONTFILE    = "assets/OxygenMono-Regular.ttf"
+    TEXTCACHESIZE   = 64 #labels
 
 
 class ImageConstants:
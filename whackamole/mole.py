@@ -7,28 +7,57 @@ A simple Whack a Mole game written with PyGame
 :copyright: (c) 2018 Matt Cowley (IPv4)
 """
 
-from random import randint, choice
+from pygame import time
 
-from pygame import image, transform, time
+from .constants import MoleConstants, LevelConstants, HoleConstants
 
-from .constants import ImageConstants, MoleConstants, LevelConstants, HoleConstants
+
+class MoleState:
+    """
+    States of the mole showing animation
+    """
+
+    HIDDEN          = 0
+    UP              = 1
+    DOWN            = -1
+
+
+class MoleEvent:
+    """
+    Hole changes reported by Mole.do_display
+    """
+
+    NONE            = -1
+    NEW_HOLE        = 0
+    OLD_HOLE        = 1
 
 
 class Mole:
     """
     Provides the mole used in game
+    Takes :positions: as the shared per-hole, per-frame position table from Mole.build_positions
+    Takes :random: as the board's Random instance
     """
 
-    def __init__(self):
-        # Load images
-        self.img_normal = image.load(ImageConstants.IMAGEMOLENORMAL)
-        self.img_normal = transform.scale(self.img_normal, (MoleConstants.MOLEWIDTH, MoleConstants.MOLEHEIGHT))
-        self.img_hit = image.load(ImageConstants.IMAGEMOLEHIT)
-        self.img_hit = transform.scale(self.img_hit, (MoleConstants.MOLEWIDTH, MoleConstants.MOLEHEIGHT))
+    __slots__ = ("positions", "random", "showing_state", "showing_counter", "show_time", "current_hole", "last_hole",
+                 "show_frame", "cooldown", "hit", "hold_end", "cooldown_end", "stun_end", "result")
+
+    # Total number of frames to show for popping up (not timed)
+    frames = 5
+
+    # Per-level caches for chance and timeLimits
+    chances = {}
+    limits = {}
+
+    def __init__(self, positions, random):
+        # Precomputed positions, indexed by hole then frame
+        self.positions = positions
+
+        # Shared board RNG, so the board state can be snapshot
+        self.random = random
 
         # State of showing animation
-        # 0 = No, 1 = Doing Up, -1 = Doing Down
-        self.showing_state = 0
+        self.showing_state = MoleState.HIDDEN
 
         # Hold timestamp for staying up
         self.showing_counter = 0
@@ -36,162 +65,227 @@ class Mole:
         # Hold how long mole will stay up
         self.show_time = 0
 
-        # Our current hole data
-        self.current_hole = (0, 0)
-        self.last_hole = (0, 0)
+        # Our current hole index (-1 = none yet)
+        self.current_hole = -1
+        self.last_hole = -1
 
         # Current frame of showing animation
         self.show_frame = 0
 
-        # Total number of frames to show for popping up (not timed)
-        self.frames = 5
-
         # Cooldown from last popup
         self.cooldown = 0
 
         # Indicates if mole is hit
-        # False = Not hit, timestamp for stunned freeze
-        self.hit = False
+        # 0 = Not hit, timestamp for stunned freeze
+        self.hit = 0
 
-    @property
-    def image(self):
-        if self.hit != False: return self.img_hit
-        return self.img_normal
+        # When the hold, cooldown and stun end, so ticks compare without arithmetic
+        self.hold_end = 0
+        self.cooldown_end = 0
+        self.stun_end = 0
 
-    def chance(self, level):
-        level -= 1  # Start at 0
+        # Reused result of do_display: [should display, MoleEvent, hole index]
+        self.result = [False, MoleEvent.NONE, -1]
 
-        levelChance = 1 + ((LevelConstants.LEVELMOLECHANCE / 100) * level)
+    @classmethod
+    def build_positions(cls, holes):
+        """
+        Precomputes the mole position for every hole and animation frame
+        Returns list (per hole) of tuples (per show_frame) of (x, y)
+        """
 
-        chance = int((MoleConstants.MOLECHANCE ** -1) * levelChance)
-        return chance
+        offsetX = (HoleConstants.HOLEWIDTH - MoleConstants.MOLEWIDTH) / 2
+        offsetY = HoleConstants.HOLEHEIGHT - (MoleConstants.MOLEHEIGHT * 1.2)
 
-    def timeLimits(self, level):
-        level -= 1  # Start at 0
+        # Sink offset per show_frame, fully down at 0 and fully up at frames
+        offsets = [MoleConstants.MOLEHEIGHT * (MoleConstants.MOLEDEPTH / cls.frames * (cls.frames - f) / 100)
+                   for f in range(cls.frames + 1)]
 
-        levelTime = 1 - ((LevelConstants.LEVELMOLESPEED / 100) * level)
-        if levelTime < 0: levelTime = 0  # No wait, just up & down
+        return [tuple((holeX + offsetX, holeY + offsetY + offset) for offset in offsets)
+                for holeX, holeY in holes]
+
+    def chance(self, level):
+        """
+        Returns the probability of popping up each tick
+        """
 
-        timeMin = int(MoleConstants.MOLEUPMIN * 1000 * levelTime)
-        timeMax = int(MoleConstants.MOLEUPMAX * 1000 * levelTime)
+        if level not in self.chances:
+            levelChance = 1 + ((LevelConstants.LEVELMOLECHANCE / 100) * (level - 1))  # Start at 0
+            # Same odds as randint(0, n) == 0, without allocating an int per tick
+            self.chances[level] = 1 / (int((MoleConstants.MOLECHANCE ** -1) * levelChance) + 1)
+        return self.chances[level]
 
-        return (timeMin, timeMax)
+    def timeLimits(self, level):
+        if level not in self.limits:
+            levelTime = 1 - ((LevelConstants.LEVELMOLESPEED / 100) * (level - 1))  # Start at 0
+            if levelTime < 0: levelTime = 0  # No wait, just up & down
+
+            timeMin = int(MoleConstants.MOLEUPMIN * 1000 * levelTime)
+            timeMax = int(MoleConstants.MOLEUPMAX * 1000 * levelTime)
+            self.limits[level] = (timeMin, timeMax)
+        return self.limits[level]
+
+    def reschedule(self, level):
+        """
+        Shortens the current hold to fit the time limits of :level:
+        """
+
+        if self.showing_state == MoleState.UP:
+            self.show_time = min(self.show_time, self.timeLimits(level)[1])
+            self.update_deadlines()
+
+    def update_deadlines(self):
+        """
+        Recalculates hold_end, cooldown_end and stun_end from their timestamps
+        """
+
+        self.hold_end = self.showing_counter + self.show_time
+        self.cooldown_end = self.cooldown + MoleConstants.MOLECOOLDOWN
+        self.stun_end = self.hit + MoleConstants.MOLESTUNNED
+
+    def do_display(self, holes, level, now, do_tick=True):
+        """
+        Ticks the mole at :now: ticks, picking from the free hole indexes in :holes:
+        Returns the reused result list [should display, MoleEvent, hole index]
+        """
+
+        result = self.result
+        result[1] = MoleEvent.NONE
 
-    def do_display(self, holes, level, do_tick=True):
         # If in cooldown
         if self.cooldown != 0:
-            if time.get_ticks() - self.cooldown < MoleConstants.MOLECOOLDOWN:
-                return [False]
-            else:
+            result[0] = False
+            if now >= self.cooldown_end:
                 self.cooldown = 0
-                return [False, 1, self.last_hole]
+                result[1] = MoleEvent.OLD_HOLE
+                result[2] = self.last_hole
+            return result
 
         # If doing a tick
         if do_tick:
 
             # Random choice if not showing
-            new_hole = False
-            if self.showing_state == 0 and holes:
+            if self.showing_state == MoleState.HIDDEN and holes:
                 # Reset
                 self.show_frame = 0
-                self.hit = False
+                self.hit = 0
 
                 # Pick
-                random = randint(0, self.chance(level))
-                if random == 0:
-                    self.showing_state = 1
+                if self.random.random() < self.chance(level):
+                    self.showing_state = MoleState.UP
                     self.showing_counter = 0
 
-                    self.show_time = randint(*self.timeLimits(level))
+                    self.show_time = self.random.randint(*self.timeLimits(level))
 
                     # Pick a new hole, don't pick the last one, don't infinite loop
                     self.current_hole = self.last_hole
                     if len(holes) > 1 or self.current_hole != holes[0]:
                         while self.current_hole == self.last_hole:
-                            self.current_hole = choice(holes)
+                            self.current_hole = self.random.choice(holes)
                         self.last_hole = self.current_hole
-                        new_hole = True
+                        result[1] = MoleEvent.NEW_HOLE
+                        result[2] = self.current_hole
 
             # Show as popped up for a bit
-            if self.showing_state == 1 and self.showing_counter != 0:
-                if time.get_ticks() - self.showing_counter >= self.show_time:
-                    self.showing_state = -1
+            if self.showing_state == MoleState.UP and self.showing_counter != 0:
+                if now >= self.hold_end:
+                    self.showing_state = MoleState.DOWN
                     self.showing_counter = 0
 
-            # Return if game should display, including new hole data
-            if new_hole:
-                return [True, 0, self.current_hole]
-
         # Return if game should display
-        return [(not self.showing_state == 0)]
+        result[0] = self.showing_state != MoleState.HIDDEN
+        return result
 
-    def get_base_pos(self):
-        holeX, holeY = self.current_hole
-        offset = (HoleConstants.HOLEWIDTH - MoleConstants.MOLEWIDTH) / 2
+    def next_change(self, do_tick=True):
+        """
+        Returns ms until the mole next changes by itself, 0 if it is animating, None if it never will
+        """
+
+        now = time.get_ticks()
+
+        # Cooldown expiry frees the hole
+        if self.cooldown != 0:
+            return max(0, self.cooldown_end - now)
+
+        # Ticking moles may pop up or move on any frame
+        if do_tick:
+            return 0
 
-        moleX = holeX + offset
-        moleY = (holeY + HoleConstants.HOLEHEIGHT) - (MoleConstants.MOLEHEIGHT * 1.2)
-        return (moleX, moleY)
+        # Stun expiry sends the mole back down
+        if self.hit != 0 and self.showing_state != MoleState.HIDDEN:
+            remain = self.stun_end - now
+            if remain > 0:
+                return remain
 
-    def get_hole_pos(self, do_tick=True):
-        moleX, moleY = self.get_base_pos()
+        return None
 
-        frame = 0
+    def get_base_pos(self):
+        return self.positions[self.current_hole][self.frames]
+
+    def get_hole_pos(self, now, do_tick=True):
+        frames = self.positions[self.current_hole]
 
         # Stunned
-        if self.hit != False:
-            if time.get_ticks() - self.hit >= MoleConstants.MOLESTUNNED:
+        if self.hit != 0:
+            if now >= self.stun_end:
                 # Unfrozen after hit, hide
-                if self.showing_state != 0:
-                    self.showing_state = -1
+                if self.showing_state != MoleState.HIDDEN:
+                    self.showing_state = MoleState.DOWN
             else:
                 # Frozen from hit
                 do_tick = False
 
         # Going Up
-        if self.showing_state == 1:
+        if self.showing_state == MoleState.UP:
             if self.show_frame <= self.frames:
-                frame = MoleConstants.MOLEDEPTH / self.frames * (self.frames - self.show_frame)
+                pos = frames[self.show_frame]
                 if do_tick: self.show_frame += 1
-            else:
-                # Hold
-                if self.showing_counter == 0:
-                    self.showing_counter = time.get_ticks()
+                return pos
+
+            # Hold
+            if self.showing_counter == 0:
+                self.showing_counter = now
+                self.update_deadlines()
+            return frames[self.frames]
 
         # Going Down
-        if self.showing_state == -1:
+        if self.showing_state == MoleState.DOWN:
             if do_tick: self.show_frame -= 1
             if self.show_frame >= 0:
-                frame = MoleConstants.MOLEDEPTH / self.frames * (self.frames - self.show_frame)
-            else:
-                # Reset
-                self.showing_state = 0
-                frame = MoleConstants.MOLEDEPTH
-                # Begin cooldown
-                if do_tick: self.cooldown = time.get_ticks()
+                return frames[min(self.show_frame, self.frames)]
 
-        moleY += (MoleConstants.MOLEHEIGHT * (frame / 100))
+            # Reset
+            self.showing_state = MoleState.HIDDEN
+            # Begin cooldown
+            if do_tick:
+                self.cooldown = now
+                self.update_deadlines()
+            return frames[0]
 
-        return (moleX, moleY)
+        return frames[self.frames]
 
     def is_hit(self, pos):
+        # Check is in valid to-be hit state
+        if self.showing_state == MoleState.HIDDEN:
+            return False
+
         mouseX, mouseY = pos
+        now = time.get_ticks()
 
         # Top Left
-        moleX1, moleY1 = self.get_hole_pos(False)
+        moleX1, moleY1 = self.get_hole_pos(now, False)
         # Bottom Right
         moleX2, moleY2 = (moleX1 + MoleConstants.MOLEWIDTH, moleY1 + MoleConstants.MOLEHEIGHT)
 
-        # Check is in valid to-be hit state
-        if self.showing_state != 0:
-            # Check x
-            if mouseX >= moleX1 and mouseX <= moleX2:
-                # Check y
-                if mouseY >= moleY1 and mouseY <= moleY2:
-                    # Check is not stunned
-                    if self.hit is False:
-                        self.hit = time.get_ticks()
-                        return 1
-                    else:
-                        return 2
+        # Check x
+        if mouseX >= moleX1 and mouseX <= moleX2:
+            # Check y
+            if mouseY >= moleY1 and mouseY <= moleY2:
+                # Check is not stunned
+                if self.hit == 0:
+                    self.hit = now
+                    self.update_deadlines()
+                    return 1
+                else:
+                    return 2
         return False
@@ -11,48 +11,99 @@ from .constants import LevelConstants, GameConstants
 from .text import Text
 
 
+class ScoreEvent:
+    """
+    Changes reported to Score subscribers
+    """
+
+    CHANGE          = 0
+    LEVEL           = 1
+
+
 class Score:
     """
     Handles the scoring for the player
+    Derived values are plain fields, updated only when hits or misses change
     """
 
     def __init__(self, text: Text):
+        self.text = text
+
+        # Callbacks taking (ScoreEvent, score)
+        self.subscribers = []
+
+        # Cached HUD segments and label
+        self.segment_score = None
+        self.segment_timer = (None, None)
+        self.last_label = (None, None, None)
+
         self.hits = 0
         self.misses = 0
-        self.text = text
+        self.level = 1
+        self.update()
 
-    @property
-    def score(self):
-        return (self.hits - (self.misses / 2)) * 2
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
 
-    @property
-    def level(self):
+    def update(self, *, notify=True):
+        """
+        Recalculates the derived values, and notifies subscribers if :notify: is set
+        """
+
+        self.score = (self.hits - (self.misses / 2)) * 2
+        self.attempts = self.hits + self.misses
+        self.hits_percent = 0 if self.attempts == 0 else self.hits / self.attempts * 100
+        self.misses_percent = 0 if self.attempts == 0 else self.misses / self.attempts * 100
+
+        previous = self.level
         if self.score < 0:
-            return 1
+            self.level = 1
         else:
-            return int(1 + (self.score // LevelConstants.LEVELGAP))
+            self.level = int(1 + (self.score // LevelConstants.LEVELGAP))
 
-    @property
-    def attempts(self):
-        return self.hits + self.misses
+        # Invalidate the score segment
+        self.segment_score = None
 
-    def disp_score(self, timer, debug):
-        # Generate hit/miss data
-        hits = [self.hits, 0 if self.attempts == 0 else self.hits / self.attempts * 100]
-        misses = [self.misses, 0 if self.attempts == 0 else self.misses / self.attempts * 100]
+        if not notify:
+            return
 
-        # Generate score text
-        text = "Score: {:,.0f} / Hits: {:,} ({:,.1f}%) / Misses: {:,} ({:,.1f}%) / Level: {:,.0f}".format(
-            self.score, hits[0], hits[1], misses[0], misses[1], self.level
-        )
+        for callback in self.subscribers:
+            callback(ScoreEvent.CHANGE, self)
+            if self.level != previous:
+                callback(ScoreEvent.LEVEL, self)
+
+    def set(self, *, hits=None, misses=None, notify=True):
+        """
+        Sets :hits: and/or :misses:, updating only if either changed
+        Set :notify: to False to update without notifying subscribers, e.g. when restoring state
+        """
 
-        # Display timer
+        hits = self.hits if hits is None else hits
+        misses = self.misses if misses is None else misses
+        if hits == self.hits and misses == self.misses:
+            return
+
+        self.hits = hits
+        self.misses = misses
+        self.update(notify=notify)
+
+    def disp_score(self, timer, debug):
+        # Generate score text
+        if self.segment_score is None:
+            self.segment_score = \
+                "Score: {:,.0f} / Hits: {:,} ({:,.1f}%) / Misses: {:,} ({:,.1f}%) / Level: {:,.0f}".format(
+                    self.score, self.hits, self.hits_percent, self.misses, self.misses_percent, self.level
+                )
+        text = self.segment_score
+
+        # Display timer, only reformatted when the shown value changes
+        # Rounded half up, as Board.next_change expects
         if timer:
-            display = None
-            if timer == -1: display = "Click to begin..."
-            if timer < 0: timer = 0
-            if not display: display = "{:,.0f}s".format(timer)
-            text += " / Time Remaining: {}".format(display)
+            shown = -1 if timer == -1 else int(max(timer, 0) + 0.5)
+            if self.segment_timer[0] != shown:
+                display = "Click to begin..." if shown == -1 else "{:,.0f}s".format(shown)
+                self.segment_timer = (shown, " / Time Remaining: {}".format(display))
+            text += self.segment_timer[1]
 
         # Add any extra readout data
         if debug:
@@ -65,11 +116,16 @@ class Score:
         return text
 
     def label(self, *, timer=None, debug={}, size=1):
-        return self.text.get_label(self.disp_score(timer, debug), "/", scale=size,
-                                   width=GameConstants.GAMEWIDTH, background=(0, 0, 0, 0.4 * 255))
+        text = self.disp_score(timer, debug)
+
+        # Reuse the last render if nothing shown has changed
+        if self.last_label[:2] != (text, size):
+            self.last_label = (text, size, self.text.get_label(text, "/", scale=size, width=GameConstants.GAMEWIDTH,
+                                                               background=(0, 0, 0, 0.4 * 255)))
+        return self.last_label[2]
 
     def hit(self):
-        self.hits += 1
+        self.set(hits=self.hits + 1)
 
     def miss(self):
-        self.misses += 1
+        self.set(misses=self.misses + 1)
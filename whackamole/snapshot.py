@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+from struct import Struct
+
+from pygame import time
+
+from .mole import Mole, MoleState
+
+
+class Snapshot:
+    """
+    Packs the complete state of a board, including its RNG, into a fixed-layout binary blob
+    Timestamps are stored as ages relative to the clock, so a snapshot can be restored at any time
+    """
+
+    MAGIC           = b"WAMS"
+    VERSION         = 1
+
+    # Magic, version, holes, moles, free holes, hits, misses, timer_start, show_hit, show_miss
+    HEADER          = "<4sHiiiiiiii"
+    # Mersenne Twister state words, then whether gauss_next is set and its value
+    RNG             = "625I?d"
+    # Free hole indexes, padded with -1 to the hole count
+    HOLE            = "i"
+    # showing_state, show_frame, current_hole, last_hole, show_time, showing_counter, cooldown, hit
+    MOLE            = "bbiiiiii"
+
+    header = Struct(HEADER)
+    structs = {}
+
+    @classmethod
+    def struct(cls, holes, moles):
+        """
+        Gets the compiled layout for a board of :holes: holes and :moles: moles
+        Returns Struct
+        """
+
+        key = (holes, moles)
+        if key not in cls.structs:
+            cls.structs[key] = Struct(cls.HEADER + cls.RNG + cls.HOLE * holes + cls.MOLE * moles)
+        return cls.structs[key]
+
+    @staticmethod
+    def age(now, timestamp):
+        # 0 is unset, kept as -1
+        return -1 if timestamp == 0 else now - timestamp
+
+    @staticmethod
+    def stamp(now, age):
+        # Move 1ms back if the timestamp would be mistaken for unset
+        return 0 if age == -1 else (now - age) or -1
+
+    @classmethod
+    def save(cls, board):
+        """
+        Captures the state of :board:
+        Returns bytes
+        """
+
+        now = time.get_ticks()
+        age = cls.age
+        holes = len(board.holes)
+        free_holes = board.free_holes
+
+        values = [cls.MAGIC, cls.VERSION, holes, len(board.moles), len(free_holes),
+                  board.score.hits, board.score.misses, age(now, board.timer_start),
+                  age(now, board.show_hit), age(now, board.show_miss)]
+        _, words, gauss_next = board.random.getstate()
+        values.extend(words)
+        values.extend((gauss_next is not None, gauss_next or 0.0))
+        values.extend(free_holes)
+        values.extend([-1] * (holes - len(free_holes)))
+        for mole in board.moles:
+            values.extend((mole.showing_state, mole.show_frame, mole.current_hole, mole.last_hole, mole.show_time,
+                           age(now, mole.showing_counter), age(now, mole.cooldown), age(now, mole.hit)))
+
+        return cls.struct(holes, len(board.moles)).pack(*values)
+
+    @classmethod
+    def restore(cls, board, data):
+        """
+        Restores :board: to the state captured in :data:
+        Raises ValueError if the snapshot is malformed or not for a board of the same size
+        """
+
+        if len(data) < cls.header.size:
+            raise ValueError("Snapshot is {} bytes, shorter than its header".format(len(data)))
+
+        magic, version, holes, moles, free, *_ = cls.header.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Not a version {} snapshot".format(cls.VERSION))
+        if holes != len(board.holes) or moles != len(board.moles):
+            raise ValueError("Snapshot is for {} holes and {} moles, board has {} and {}".format(
+                holes, moles, len(board.holes), len(board.moles)))
+
+        layout = cls.struct(holes, moles)
+        if len(data) != layout.size:
+            raise ValueError("Snapshot is {} bytes, expected {}".format(len(data), layout.size))
+        if not 0 <= free <= holes:
+            raise ValueError("Snapshot has {} free holes out of {}".format(free, holes))
+
+        values = layout.unpack(data)
+        now = time.get_ticks()
+        stamp = cls.stamp
+
+        # Check every index before changing anything, so a bad snapshot leaves the board as it was
+        i = 10 + 627
+        free_holes = values[i:i + free]
+        if len(set(free_holes)) != free or not all(0 <= hole < holes for hole in free_holes):
+            raise ValueError("Snapshot has invalid free holes")
+        states = (MoleState.HIDDEN, MoleState.UP, MoleState.DOWN)
+        for mole in range(moles):
+            j = i + holes + mole * 8
+            showing_state, show_frame, current_hole, last_hole = values[j:j + 4]
+            if showing_state not in states or not -1 <= show_frame <= Mole.frames + 1 \
+                    or not -1 <= current_hole < holes or not -1 <= last_hole < holes:
+                raise ValueError("Snapshot has an invalid state for mole {}".format(mole))
+
+        # RNG, first as setstate also checks its state before changing anything
+        i = 10
+        board.random.setstate((3, values[i:i + 625], values[i + 626] if values[i + 625] else None))
+        i += 627
+
+        # Board and score, without notifying as the restored moles are already scheduled
+        board.score.set(hits=values[5], misses=values[6], notify=False)
+        board.timer_start = stamp(now, values[7])
+        board.show_hit = stamp(now, values[8])
+        board.show_miss = stamp(now, values[9])
+
+        # Holes
+        board.free_holes[:] = free_holes
+        used_holes = board.used_holes
+        for hole in range(holes):
+            used_holes[hole] = True
+        for hole in board.free_holes:
+            used_holes[hole] = False
+        i += holes
+
+        # Moles
+        for mole in board.moles:
+            (mole.showing_state, mole.show_frame, mole.current_hole, mole.last_hole, mole.show_time,
+             showing_counter, cooldown, hit) = values[i:i + 8]
+            mole.showing_counter = stamp(now, showing_counter)
+            mole.cooldown = stamp(now, cooldown)
+            mole.hit = stamp(now, hit)
+            mole.update_deadlines()
+            i += 8
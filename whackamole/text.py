@@ -7,7 +7,7 @@ A simple Whack a Mole game written with PyGame
 :copyright: (c) 2018 Matt Cowley (IPv4)
 """
 
-from pygame import font, Surface, SRCALPHA
+from pygame import display, font, register_quit, Surface, SRCALPHA
 
 from .constants import TextConstants
 
@@ -17,14 +17,35 @@ class Text:
     Handles all the text used
     """
 
+    # Loaded fonts by size and recent labels by arguments, shared by all Text instances
+    # Fonts are freed by pygame.quit, so both are dropped then, see clear
+    fonts = {}
+    labels = {}
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops the cached fonts and labels
+        """
+
+        cls.fonts.clear()
+        cls.labels.clear()
+
     def font(self, size):
-        # f = font.SysFont("monospace", int(size))
-        f = font.Font(TextConstants.TEXTFONTFILE, int(size))
-        # Generate test char
-        test = f.render("a", 1, (0, 0, 0))
-        # Calc line sizes
-        line_width = test.get_width()
-        return (f, line_width)
+        size = int(size)
+        if size not in self.fonts:
+            # Quit callbacks only run once, so register with each first font
+            if not self.fonts:
+                register_quit(self.clear)
+
+            # f = font.SysFont("monospace", size)
+            f = font.Font(TextConstants.TEXTFONTFILE, size)
+            # Generate test char
+            test = f.render("a", 1, (0, 0, 0))
+            # Calc line sizes
+            line_width = test.get_width()
+            self.fonts[size] = (f, line_width)
+        return self.fonts[size]
 
     def wrap(self, unsafe, length, break_char):
         """
@@ -79,9 +100,17 @@ class Text:
                   background=None):
         """
         Generates text in a given area, wrapped at :break_char:
-        Returns PyGame surface
+        Returns PyGame surface, reused for repeated calls so must not be modified
         """
 
+        key = (string, break_char, width, height, scale, color, background)
+        if key in self.labels:
+            return self.labels[key]
+
+        # Drop the oldest label when full
+        if len(self.labels) >= TextConstants.TEXTCACHESIZE:
+            del self.labels[next(iter(self.labels))]
+
         # Scaling
         if width:
             width = int(width * (scale ** -1))
@@ -97,7 +126,8 @@ class Text:
         if not height:
             height = sum([f.get_height() + 2 for f in labels])
         surface = Surface((width, height), SRCALPHA, 32)
-        surface = surface.convert_alpha()
+        if display.get_surface() is not None:
+            surface = surface.convert_alpha()
         if background:
             surface.fill(background)
 
@@ -107,4 +137,5 @@ class Text:
             surface.blit(label, (0, y))
             y += label.get_height() + 2
 
+        self.labels[key] = surface
         return surface
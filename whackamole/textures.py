@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""
+Whack a Mole
+~~~~~~~~~~~~~~~~~~~
+A simple Whack a Mole game written with PyGame
+:copyright: (c) 2018 Matt Cowley (IPv4)
+"""
+
+from weakref import WeakKeyDictionary
+
+from pygame._sdl2.video import Window, Renderer, Texture
+
+from .constants import Constants
+
+
+class TextureSurface:
+    """
+    Draw target for a board that renders with GPU textures instead of software blits
+    Each source surface is uploaded to a texture once, and drawn as a textured quad
+    Takes :scale: as the integer scale of the window, for hi-DPI output
+    """
+
+    def __init__(self, *, scale: int = 1):
+        if not isinstance(scale, int) or scale < 1:
+            raise ValueError("scale must be a positive integer")
+
+        self.window = Window(Constants.TEXTTITLE, size=(Constants.GAMEWIDTH * scale, Constants.GAMEHEIGHT * scale))
+        self.renderer = Renderer(self.window)
+        self.renderer.scale = (scale, scale)
+        self.scale = scale
+
+        # Textures by source surface, dropped with the surface
+        self.textures = WeakKeyDictionary()
+
+    def get_size(self):
+        return (Constants.GAMEWIDTH, Constants.GAMEHEIGHT)
+
+    def texture(self, surface):
+        """
+        Gets the texture for :surface:, uploading it if this is the first use
+        Returns PyGame texture
+        """
+
+        texture = self.textures.get(surface)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, surface)
+            self.textures[surface] = texture
+        return texture
+
+    def blit(self, source, dest, area=None):
+        texture = self.texture(source)
+        if area is None:
+            texture.draw(dstrect=(int(dest[0]), int(dest[1]), texture.width, texture.height))
+        elif area.width and area.height:
+            texture.draw(srcrect=area, dstrect=(int(dest[0]), int(dest[1]), area.width, area.height))
+
+    def blits(self, blit_sequence, doreturn=True):
+        for draw in blit_sequence:
+            self.blit(*draw)
+
+    def flip(self):
+        self.renderer.present()
+        self.renderer.clear()
+
+    def to_surface(self):
+        """
+        Reads back the frame drawn since the last flip, at the scaled window size
+        Returns PyGame surface
+        """
+
+        # Reading back while scaled crashes pygame, so read the full output unscaled
+        self.renderer.scale = (1, 1)
+        surface = self.renderer.to_surface()
+        self.renderer.scale = (self.scale, self.scale)
+        return surface